@@ -41,56 +41,73 @@ Quick Start:
 
 __version__ = "2.4.0"
 
-from typing import List, Optional
+import importlib
+from typing import TYPE_CHECKING, Any, List, Optional
 
-# Core agent classes
-from .agents import BaseAgent
+if TYPE_CHECKING:
+    from .agents import BaseAgent
+    from .tools.base import Tool
 
-# Clean Architecture Components
-from .core import CleanAgent, CleanOrchestrator
-from .core.config import Config, config_manager
+# Public attributes are imported on first access (PEP 562) so that
+# ``import equitrcoder`` stays cheap for callers that only need one symbol.
+_LAZY_ATTRIBUTES = {
+    # Core agent classes
+    "BaseAgent": ".agents",
+    # Clean Architecture Components
+    "CleanAgent": ".core",
+    "CleanOrchestrator": ".core",
+    "Config": ".core.config",
+    "config_manager": ".core.config",
+    # Core functionality
+    "SessionData": ".core.session",
+    "SessionManagerV2": ".core.session",
+    "get_available_modes": ".modes.loader",
+    "get_mode_callable": ".modes.loader",
+    "mode_loader": ".modes.loader",
+    "run_multi_agent_parallel": ".modes.multi_agent_mode",
+    "run_multi_agent_sequential": ".modes.multi_agent_mode",
+    "run_single_agent_mode": ".modes.single_agent_mode",
+    # Programmatic Interface
+    "EquitrCoder": ".programmatic",
+    "ExecutionResult": ".programmatic",
+    "MultiAgentTaskConfiguration": ".programmatic",
+    "TaskConfiguration": ".programmatic",
+    "create_multi_agent_coder": ".programmatic",
+    "create_single_agent_coder": ".programmatic",
+    # Tools
+    "Tool": ".tools.base",
+    "ToolResult": ".tools.base",
+    "discover_tools": ".tools.discovery",
+    # Git Management
+    # Utility classes
+    "GitManager": ".utils",
+    "RestrictedFileSystem": ".utils",
+    "ScaffoldError": ".utils",
+    "create_git_manager": ".utils",
+    "ensure_extension_structure": ".utils",
+    "get_equitr_home": ".utils",
+    "get_extension_search_paths": ".utils",
+    "get_project_config_dir": ".utils",
+    "get_user_extensions_root": ".utils",
+    "resolve_extension_root": ".utils",
+    "scaffold_mode": ".utils",
+    "scaffold_profile": ".utils",
+    "scaffold_tool": ".utils",
+}
 
-# Core functionality
-from .core.session import SessionData, SessionManagerV2
-from .modes.loader import (
-    get_available_modes,
-    get_mode_callable,
-    mode_loader,
-)
-from .modes.multi_agent_mode import run_multi_agent_parallel, run_multi_agent_sequential
-from .modes.single_agent_mode import run_single_agent_mode
-
-# Programmatic Interface
-from .programmatic import (
-    EquitrCoder,
-    ExecutionResult,
-    MultiAgentTaskConfiguration,
-    TaskConfiguration,
-    create_multi_agent_coder,
-    create_single_agent_coder,
-)
 
-# Tools
-from .tools.base import Tool, ToolResult
-from .tools.discovery import discover_tools
-
-# Git Management
-# Utility classes
-from .utils import (
-    GitManager,
-    RestrictedFileSystem,
-    ScaffoldError,
-    create_git_manager,
-    ensure_extension_structure,
-    get_equitr_home,
-    get_extension_search_paths,
-    get_project_config_dir,
-    get_user_extensions_root,
-    resolve_extension_root,
-    scaffold_mode,
-    scaffold_profile,
-    scaffold_tool,
-)
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     # Version
@@ -144,8 +161,8 @@ __all__ = [
 def create_single_agent(
     max_cost: Optional[float] = None,
     max_iterations: Optional[int] = None,
-    tools: Optional[List[Tool]] = None,
-) -> BaseAgent:
+    tools: Optional[List["Tool"]] = None,
+) -> "BaseAgent":
     """
     Convenience function to create a single agent with common settings.
 
@@ -157,6 +174,9 @@ def create_single_agent(
     Returns:
         Configured BaseAgent instance
     """
+    from .agents import BaseAgent
+    from .tools.discovery import discover_tools
+
     agent = BaseAgent(max_cost=max_cost, max_iterations=max_iterations)
 
     if tools:
@@ -189,6 +209,8 @@ async def run_task_single_agent(
     Returns:
         Task execution result
     """
+    from .modes.single_agent_mode import run_single_agent_mode
+
     return await run_single_agent_mode(
         task_description=task_description,
         agent_model=agent_model,
@@ -216,6 +238,8 @@ async def run_task_multi_agent(
     Returns:
         Task execution result
     """
+    from .modes.multi_agent_mode import run_multi_agent_sequential
+
     return await run_multi_agent_sequential(
         task_description=task_description,
         num_agents=num_agents,
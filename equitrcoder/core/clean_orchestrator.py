@@ -9,7 +9,6 @@ from typing import Any, Dict, List, Optional
 
 from ..providers.litellm import LiteLLMProvider, Message
 from ..tools.builtin.todo import get_todo_manager, set_global_todo_file
-from ..tools.discovery import discover_tools
 from .profile_manager import ProfileManager
 from .unified_config import get_config_manager
 
@@ -198,6 +197,10 @@ class CleanOrchestrator:
     ):
         """Generates and saves the structured todo plan using a two-stage process."""
 
+        # Imported here: tools.discovery depends on core, so a module-level
+        # import would be circular when equitrcoder.tools is imported first.
+        from ..tools.discovery import discover_tools
+
         # Get available tools context
         available_tools = discover_tools()
         tools_context = "Available tools that agents will have access to:\n"
@@ -399,6 +402,7 @@ class CleanOrchestrator:
                     pass
 
                 # Add todos to the group
+                titles: List[str] = []
                 for todo_data in todos_data:
                     if isinstance(todo_data, dict):
                         t = (
@@ -413,17 +417,23 @@ class CleanOrchestrator:
                     # Prefer concise titles; trim softly if extremely long
                     if len(title.split()) > 20:
                         title = " ".join(title.split()[:20])
-                    try:
-                        manager.add_todo_to_group(
-                            group_id=group_data["group_id"], title=title
-                        )
-                    except Exception as e:
-                        print(f"⚠️  Skipping todo due to error: {e}")
-                        continue
+                    titles.append(title)
 
-                print(
-                    f"    ✅ Added {len(todos_data)} lightweight todos to {group_data['group_id']}"
-                )
+                # Single plan write for the whole group
+                created = None
+                try:
+                    created = manager.add_todos_to_group(
+                        group_id=group_data["group_id"], titles=titles
+                    )
+                except Exception as e:
+                    print(f"⚠️  Could not add todos to {group_data['group_id']}: {e}")
+
+                if created is None:
+                    print(f"⚠️  No todos added to {group_data['group_id']}")
+                else:
+                    print(
+                        f"    ✅ Added {len(created)} lightweight todos to {group_data['group_id']}"
+                    )
             except Exception as e:
                 # Strict: no silent fallbacks
                 raise e
@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field
 class Task(BaseModel):
     """Individual task in a multi-agent system."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex[:8])
     description: str = Field(..., description="What needs to be done")
     status: Literal["todo", "in_progress", "done", "failed"] = "todo"
     files: List[str] = Field(
@@ -39,13 +39,14 @@ class Task(BaseModel):
         error: Optional[str] = None,
     ) -> None:
         """Update task status and timestamps."""
+        now = datetime.now()
         self.status = new_status
-        self.updated_at = datetime.now()
+        self.updated_at = now
 
         if new_status == "in_progress" and self.started_at is None:
-            self.started_at = datetime.now()
+            self.started_at = now
         elif new_status in ["done", "failed"]:
-            self.completed_at = datetime.now()
+            self.completed_at = now
 
         if result:
             self.result = result
@@ -96,7 +97,7 @@ class TaskList(BaseModel):
         task = self.get_task(task_id)
         if task:
             task.update_status(status, result, error)
-            self.updated_at = datetime.now()
+            self.updated_at = task.updated_at
             return True
         return False
 
@@ -174,12 +175,12 @@ class TaskList(BaseModel):
     def from_dict(cls, data: Dict[str, Any]) -> "TaskList":
         """Create TaskList from dictionary."""
         tasks = [Task(**task_data) for task_data in data.get("tasks", [])]
-        return cls(
-            tasks=tasks,
-            created_at=datetime.fromisoformat(
-                data.get("created_at", datetime.now().isoformat())
-            ),
-            updated_at=datetime.fromisoformat(
-                data.get("updated_at", datetime.now().isoformat())
-            ),
-        )
+        timestamps = {}
+        # Parse stored timestamps once; missing ones fall back to the field defaults
+        for key in ("created_at", "updated_at"):
+            raw = data.get(key)
+            if raw:
+                timestamps[key] = (
+                    raw if isinstance(raw, datetime) else datetime.fromisoformat(raw)
+                )
+        return cls(tasks=tasks, **timestamps)
@@ -36,31 +36,34 @@ class TodoParser:
                 dependencies=[],
             )
             print(f"🧹 Initialized group '{group_id}'")
-        else:
+        elif existing_group.status != "pending":
             # Reset group todos by re-creating an empty group with same metadata
             self.todo_manager.update_task_group_status(group_id, "pending")
             # Simply proceed; adding new todos will represent the current state
 
-        todo_count = 0
+        task_descriptions: List[str] = []
         for i, line in enumerate(lines):
             line = line.strip()
             # Look for checkbox format: - [ ] Task description
             if line.startswith("- [ ]"):
                 task_description = line[5:].strip()  # Remove '- [ ] '
                 if task_description:
-                    try:
-                        self.todo_manager.add_todo_to_group(
-                            group_id=group_id, title=task_description
-                        )
-                        print(f"✅ Created todo {todo_count + 1}: {task_description}")
-                        todo_count += 1
-                    except Exception as e:
-                        print(
-                            f"❌ Warning: Could not create todo '{task_description}': {e}"
-                        )
+                    task_descriptions.append(task_description)
                 else:
                     print(f"⚠️ Empty task description on line {i + 1}: '{line}'")
 
+        # Add all parsed todos with a single plan write
+        todo_count = 0
+        try:
+            created = self.todo_manager.add_todos_to_group(
+                group_id=group_id, titles=task_descriptions
+            )
+            for todo in created or []:
+                todo_count += 1
+                print(f"✅ Created todo {todo_count}: {todo.title}")
+        except Exception as e:
+            print(f"❌ Warning: Could not create todos for group '{group_id}': {e}")
+
         print(f"📝 Total todos created for this isolated task: {todo_count}")
         return todo_count
 
@@ -292,7 +292,7 @@ class LiteLLMProvider:
 
     # --- Provider request helpers and chat implementation ---
     async def _make_completion_request(self, **params):
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: litellm.completion(**params))
 
     async def _make_responses_request(self, **params):
@@ -302,7 +302,7 @@ class LiteLLMProvider:
         tool calls during reasoning. We call the blocking SDK in a thread to
         avoid blocking the event loop.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: litellm.responses(**params))
 
     async def chat(
@@ -763,7 +763,7 @@ class _RateLimitGlobals:
             return wait
 
     async def _make_completion_request(self, **params):
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: litellm.completion(**params))
 
     async def chat(
@@ -935,7 +935,7 @@ class _RateLimitGlobals:
             embedding_model = model or self._get_embedding_model()
             if isinstance(text, str):
                 text = [text]
-            response = await asyncio.get_event_loop().run_in_executor(
+            response = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: litellm.embedding(model=embedding_model, input=text, **kwargs),
             )
@@ -6,7 +6,7 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
 from pydantic import BaseModel, Field
 
@@ -102,6 +102,19 @@ class TodoManager:
                 return todo
         return None
 
+    def add_todos_to_group(
+        self, group_id: str, titles: Iterable[str]
+    ) -> Optional[List[TodoItem]]:
+        """Adds several todos to an existing group, persisting the plan only once."""
+        group = self.get_task_group(group_id)
+        if group is None:
+            return None
+        todos = [TodoItem(title=title) for title in titles]
+        if todos:
+            group.todos.extend(todos)
+            self._save_plan()
+        return todos
+
     def get_task_group(self, group_id: str) -> Optional[TaskGroup]:
         """Retrieves a specific task group by its ID."""
         for group in self.plan.task_groups:
@@ -129,6 +142,38 @@ class TodoManager:
         self._save_plan()
         return target_group
 
+    def bulk_update_todo_status(
+        self, todo_ids: List[str], status: str
+    ) -> Dict[str, Optional[TaskGroup]]:
+        """Updates several todos in one pass and persists the plan only once.
+
+        Returns a mapping of each requested todo ID to its parent group, or None
+        if the todo was not found.
+        """
+        todo_index: Dict[str, Tuple[TaskGroup, TodoItem]] = {
+            todo.id: (group, todo)
+            for group in self.plan.task_groups
+            for todo in group.todos
+        }
+        results: Dict[str, Optional[TaskGroup]] = {}
+        touched_groups: Dict[str, TaskGroup] = {}
+
+        for todo_id in todo_ids:
+            entry = todo_index.get(todo_id)
+            if entry is None:
+                results[todo_id] = None
+                continue
+            group, todo = entry
+            todo.status = status
+            touched_groups[group.group_id] = group
+            results[todo_id] = group
+
+        if touched_groups:
+            for group in touched_groups.values():
+                self._check_group_completion(group)
+            self._save_plan()
+        return results
+
     def _find_group_by_todo_id(self, todo_id: str) -> Optional[TaskGroup]:
         """Find the group containing the specified todo ID"""
         for group in self.plan.task_groups:
@@ -294,8 +339,8 @@ class BulkUpdateTodoStatus(Tool):
         updated_todos = []
         failed_todos = []
 
-        for todo_id in args.todo_ids:
-            updated_group = manager.update_todo_status(todo_id, args.status)
+        results = manager.bulk_update_todo_status(args.todo_ids, args.status)
+        for todo_id, updated_group in results.items():
             if updated_group:
                 updated_groups.add(updated_group.group_id)
                 updated_todos.append(todo_id)
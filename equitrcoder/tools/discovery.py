@@ -7,12 +7,12 @@ import pkgutil
 import sys
 from pathlib import Path
 from types import ModuleType
-from typing import Iterable, List, Optional, Type
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Type
 
 from ..core.unified_config import get_config_manager
 from ..utils.paths import get_extension_search_paths
 from .base import Tool, registry
-from .mcp.config import load_mcp_config
+from .mcp.config import find_mcp_config_path, load_mcp_config
 from .mcp.dynamic_tools import MCPToolProxy
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,8 @@ class ToolDiscovery:
         self.loaded_modules = set()
         self._config_manager = get_config_manager()
         self._external_prefix = "equitrcoder_ext"
+        # Inputs seen by the last successful discovery, per project root
+        self._discovery_signatures: Dict[Path, Hashable] = {}
 
     def discover_builtin_tools(self):
         """Discover and load built-in tools."""
@@ -56,12 +58,14 @@ class ToolDiscovery:
         if not seen_custom_package and custom_package.exists():
             self._discover_tools_in_package("equitrcoder.tools.custom", custom_package)
 
-    def discover_mcp_tools(self):
+    def discover_mcp_tools(self) -> bool:
         """Discover and load MCP server tools.
 
         Two sources are used:
         1) Static modules under equitrcoder.tools.mcp (if any) for built-ins
         2) Dynamic proxies created from JSON config (mcp_servers.json)
+
+        Returns False if the MCP servers config could not be loaded.
         """
         mcp_path = Path(__file__).parent / "mcp"
         if mcp_path.exists():
@@ -71,9 +75,9 @@ class ToolDiscovery:
         cfg, path, err = load_mcp_config()
         if err:
             logger.warning(f"Failed to load MCP servers config ({path}): {err}")
-            return
+            return False
         if not cfg or not cfg.mcpServers:
-            return
+            return True
 
         for server_name, server_cfg in cfg.mcpServers.items():
             try:
@@ -265,6 +269,49 @@ class ToolDiscovery:
             )
         )
 
+    def _discovery_signature(self) -> Hashable:
+        """Describe everything discovery reads, so changes trigger a rescan."""
+
+        def _mtime(path: Optional[Path]) -> Optional[float]:
+            if path is None:
+                return None
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return None
+
+        extension_paths: List[Tuple[str, Optional[float]]] = []
+        for path in self._get_extension_paths("tools"):
+            try:
+                resolved = path.resolve()
+            except FileNotFoundError:
+                resolved = path
+            extension_paths.append((str(resolved), _mtime(resolved)))
+
+        mcp_path = find_mcp_config_path()
+        return (
+            tuple(extension_paths),
+            str(mcp_path) if mcp_path else None,
+            _mtime(mcp_path),
+        )
+
+    def discover_all(self) -> None:
+        """Discover built-in, custom and MCP tools, skipping unchanged sources.
+
+        Discovery imports modules and instantiates every tool class, so repeated
+        calls reuse the populated registry until an extension path or the MCP
+        servers config changes.
+        """
+        root = Path.cwd()
+        signature = self._discovery_signature()
+        if self._discovery_signatures.get(root) == signature:
+            return
+
+        self.discover_builtin_tools()
+        self.discover_custom_tools()
+        if self.discover_mcp_tools():
+            self._discovery_signatures[root] = signature
+
     def reload_tools(self):
         """Reload all tools."""
         # Clear registry
@@ -273,11 +320,10 @@ class ToolDiscovery:
             if module_name.startswith(self._external_prefix):
                 sys.modules.pop(module_name, None)
         self.loaded_modules.clear()
+        self._discovery_signatures.clear()
 
         # Rediscover all tools
-        self.discover_builtin_tools()
-        self.discover_custom_tools()
-        self.discover_mcp_tools()
+        self.discover_all()
 
 
 # Global tool discovery instance
@@ -291,10 +337,8 @@ def discover_tools() -> List[Tool]:
     Returns:
         List of discovered Tool instances
     """
-    # Discover all tools
-    discovery.discover_builtin_tools()
-    discovery.discover_custom_tools()
-    discovery.discover_mcp_tools()
+    # Discover all tools (cached per project root)
+    discovery.discover_all()
 
     # Return tools from registry
     return list(registry._tools.values())
@@ -102,19 +102,30 @@ class ToolCallLogger:
 
         # Set up file logger
         if self.enabled:
-            # Ensure parent directory exists (e.g., when running outside repo root)
-            self.log_file.parent.mkdir(parents=True, exist_ok=True)
-
             self.logger = logging.getLogger("tool_calls")
             self.logger.setLevel(logging.INFO)
 
-            # Create file handler
-            handler = logging.FileHandler(self.log_file)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+            # Attach one file handler per log file, so reconfiguring the
+            # logger does not duplicate every log line.
+            if not self._has_file_handler():
+                # Ensure parent directory exists (e.g., when running outside repo root)
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+
+                handler = logging.FileHandler(self.log_file)
+                formatter = logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                )
+                handler.setFormatter(formatter)
+                self.logger.addHandler(handler)
+
+    def _has_file_handler(self) -> bool:
+        """Check whether the logger already writes to this log file."""
+        target = self.log_file.resolve()
+        return any(
+            isinstance(h, logging.FileHandler)
+            and Path(h.baseFilename).resolve() == target
+            for h in self.logger.handlers
+        )
 
     def log_tool_call(
         self,
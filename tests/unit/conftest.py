@@ -0,0 +1,15 @@
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def save_counter(monkeypatch):
+    """Wrap a TodoManager's _save_plan so tests can count plan writes."""
+
+    def _wrap(manager):
+        spy = Mock(wraps=manager._save_plan)
+        monkeypatch.setattr(manager, "_save_plan", spy)
+        return spy
+
+    return _wrap
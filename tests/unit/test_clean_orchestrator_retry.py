@@ -27,6 +27,10 @@ async def test_clean_orchestrator_retries_on_invalid_json(monkeypatch, tmp_path)
         def add_todo_to_group(self, group_id, title):
             self.todos.setdefault(group_id, []).append(title)
 
+        def add_todos_to_group(self, group_id, titles):
+            self.todos.setdefault(group_id, []).extend(titles)
+            return list(titles)
+
         def get_task_group(self, group_id):
             return None
 
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+import equitrcoder
+
+
+def test_import_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, equitrcoder; "
+        "assert 'litellm' not in sys.modules; "
+        "assert 'equitrcoder.core' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_tools_modules_import_cold():
+    # Importing tools before core must not hit the tools <-> core import cycle
+    code = "import equitrcoder.tools.base, equitrcoder.tools.discovery"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_public_names_resolve():
+    from equitrcoder.programmatic import EquitrCoder
+
+    assert equitrcoder.EquitrCoder is EquitrCoder
+    assert set(equitrcoder.__all__) <= set(dir(equitrcoder))
+    for name in equitrcoder.__all__:
+        getattr(equitrcoder, name)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        getattr(equitrcoder, "does_not_exist")
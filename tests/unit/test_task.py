@@ -0,0 +1,32 @@
+from equitrcoder.core.task import Task, TaskList
+
+
+def test_update_status_uses_single_timestamp():
+    task_list = TaskList()
+    task = Task(description="Write docs")
+    task_list.add_task(task)
+
+    assert task_list.update_task_status(task.id, "in_progress")
+    assert task.started_at == task.updated_at == task_list.updated_at
+
+    task.update_status("done", result="ok")
+    assert task.completed_at == task.updated_at
+    assert task.result == "ok"
+
+
+def test_task_list_round_trip_preserves_timestamps():
+    task_list = TaskList()
+    task_list.add_task(Task(description="Write docs"))
+
+    restored = TaskList.from_dict(task_list.to_dict())
+
+    assert restored.created_at == task_list.created_at
+    assert restored.updated_at == task_list.updated_at
+    assert restored.tasks[0].description == "Write docs"
+
+
+def test_task_list_from_dict_defaults_missing_timestamps():
+    restored = TaskList.from_dict({"tasks": []})
+
+    assert restored.created_at is not None
+    assert restored.updated_at is not None
@@ -0,0 +1,57 @@
+from equitrcoder.tools.builtin.todo import TodoManager
+
+
+def _make_manager(tmp_path):
+    manager = TodoManager(todo_file=str(tmp_path / "todos.json"))
+    manager.create_task_group("grp1", "backend", "Backend work", [])
+    manager.create_task_group("grp2", "frontend", "Frontend work", ["grp1"])
+    return manager
+
+
+def test_bulk_update_todo_status_saves_once(tmp_path, save_counter):
+    manager = _make_manager(tmp_path)
+    t1 = manager.add_todo_to_group("grp1", "Create models")
+    t2 = manager.add_todo_to_group("grp1", "Create routes")
+    t3 = manager.add_todo_to_group("grp2", "Create views")
+
+    saves = save_counter(manager)
+
+    results = manager.bulk_update_todo_status(
+        [t1.id, t2.id, t3.id, "todo_missing"], "completed"
+    )
+
+    assert saves.call_count == 1
+    assert results[t1.id].group_id == "grp1"
+    assert results[t3.id].group_id == "grp2"
+    assert results["todo_missing"] is None
+    assert manager.get_task_group("grp1").status == "completed"
+    assert manager.get_task_group("grp2").status == "completed"
+
+    reloaded = TodoManager(todo_file=str(tmp_path / "todos.json"))
+    assert all(
+        t.status == "completed" for g in reloaded.plan.task_groups for t in g.todos
+    )
+
+
+def test_bulk_update_todo_status_skips_save_when_nothing_matches(
+    tmp_path, save_counter
+):
+    manager = _make_manager(tmp_path)
+    saves = save_counter(manager)
+
+    results = manager.bulk_update_todo_status(["todo_missing"], "completed")
+
+    assert results == {"todo_missing": None}
+    assert saves.call_count == 0
+
+
+def test_add_todos_to_group_saves_once(tmp_path, save_counter):
+    manager = _make_manager(tmp_path)
+    saves = save_counter(manager)
+
+    todos = manager.add_todos_to_group("grp1", ["Create models", "Create routes"])
+
+    assert saves.call_count == 1
+    assert [t.title for t in todos] == ["Create models", "Create routes"]
+    assert manager.get_task_group("grp1").todos == todos
+    assert manager.add_todos_to_group("missing", ["x"]) is None
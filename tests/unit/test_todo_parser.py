@@ -0,0 +1,28 @@
+import pytest
+
+from equitrcoder.core.todo_parser import TodoParser
+from equitrcoder.tools.builtin.todo import TodoManager
+
+
+@pytest.mark.asyncio
+async def test_parse_and_create_todos_adds_all_with_one_save(tmp_path, save_counter):
+    manager = TodoManager(todo_file=str(tmp_path / "todos.json"))
+    manager.create_task_group("my_task", "general", "Todos for my task", [])
+
+    saves = save_counter(manager)
+
+    content = "\n".join(
+        [
+            "# Todos",
+            "- [ ] Create models",
+            "- [ ]",
+            "- [x] Already done",
+            "- [ ] Create routes",
+        ]
+    )
+    count = await TodoParser(manager).parse_and_create_todos(content, "my task")
+
+    assert count == 2
+    assert saves.call_count == 1
+    titles = [t.title for t in manager.get_task_group("my_task").todos]
+    assert titles == ["Create models", "Create routes"]
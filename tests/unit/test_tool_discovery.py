@@ -0,0 +1,84 @@
+import textwrap
+
+from equitrcoder.tools.base import registry
+from equitrcoder.tools.discovery import ToolDiscovery
+
+
+def test_discover_all_runs_once_per_project_root(monkeypatch, tmp_path):
+    discovery = ToolDiscovery()
+    calls = {"n": 0}
+
+    def fake_discover():
+        calls["n"] += 1
+
+    monkeypatch.setattr(discovery, "discover_builtin_tools", fake_discover)
+    monkeypatch.setattr(discovery, "discover_custom_tools", lambda: None)
+    monkeypatch.setattr(discovery, "discover_mcp_tools", lambda: True)
+
+    discovery.discover_all()
+    discovery.discover_all()
+    assert calls["n"] == 1
+
+    # A different project root may expose different extension tools
+    monkeypatch.chdir(tmp_path)
+    discovery.discover_all()
+    assert calls["n"] == 2
+
+
+def test_discover_all_rescans_when_mcp_config_fails(monkeypatch):
+    discovery = ToolDiscovery()
+    calls = {"n": 0}
+
+    def fake_discover():
+        calls["n"] += 1
+
+    monkeypatch.setattr(discovery, "discover_builtin_tools", fake_discover)
+    monkeypatch.setattr(discovery, "discover_custom_tools", lambda: None)
+    monkeypatch.setattr(discovery, "discover_mcp_tools", lambda: False)
+
+    discovery.discover_all()
+    discovery.discover_all()
+    assert calls["n"] == 2
+
+
+def test_discover_all_picks_up_tools_added_later(monkeypatch, tmp_path):
+    tools_dir = tmp_path / "tools"
+    tools_dir.mkdir()
+    monkeypatch.setenv("EQUITR_TOOLS_PATH", str(tools_dir))
+    monkeypatch.chdir(tmp_path)
+
+    discovery = ToolDiscovery()
+    monkeypatch.setattr(discovery, "discover_builtin_tools", lambda: None)
+    monkeypatch.setattr(discovery, "discover_mcp_tools", lambda: True)
+
+    discovery.discover_all()
+    assert "late_tool" not in registry._tools
+
+    (tools_dir / "late_tool.py").write_text(
+        textwrap.dedent("""
+            from pydantic import BaseModel
+
+            from equitrcoder.tools.base import Tool, ToolResult
+
+
+            class LateTool(Tool):
+                def get_name(self):
+                    return "late_tool"
+
+                def get_description(self):
+                    return "Added after the first discovery"
+
+                def get_args_schema(self):
+                    return BaseModel
+
+                async def run(self, **kwargs):
+                    return ToolResult()
+            """),
+        encoding="utf-8",
+    )
+
+    try:
+        discovery.discover_all()
+        assert "late_tool" in registry._tools
+    finally:
+        registry._tools.pop("late_tool", None)
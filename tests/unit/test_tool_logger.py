@@ -0,0 +1,36 @@
+import logging
+
+from equitrcoder.utils.tool_logger import configure_tool_logger
+
+
+def test_configure_tool_logger_attaches_one_handler_per_file(tmp_path):
+    log_file = tmp_path / "sub" / "t.log"
+    logger = logging.getLogger("tool_calls")
+
+    def handlers_for_file():
+        return [
+            h
+            for h in logger.handlers
+            if isinstance(h, logging.FileHandler) and h.baseFilename == str(log_file)
+        ]
+
+    def remove_handlers():
+        for handler in handlers_for_file():
+            logger.removeHandler(handler)
+            handler.close()
+
+    try:
+        for _ in range(3):
+            configure_tool_logger(log_file, enabled=True)
+        # A different spelling of the same file reuses the handler too
+        configure_tool_logger(tmp_path / "sub" / ".." / "sub" / "t.log", enabled=True)
+
+        assert log_file.parent.is_dir()
+        assert len(handlers_for_file()) == 1
+
+        # Once the handler is removed, reconfiguring attaches a new one
+        remove_handlers()
+        configure_tool_logger(log_file, enabled=True)
+        assert len(handlers_for_file()) == 1
+    finally:
+        remove_handlers()